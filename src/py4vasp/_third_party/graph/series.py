@@ -94,12 +94,15 @@ class Series:
         }
 
     def _options_area(self, y, width, first_trace):
-        upper = y + width
-        lower = y - width
+        # fill lower edge forward and upper edge backward into a single buffer
+        num_points = len(y)
+        area = np.empty(2 * num_points, dtype=np.result_type(y, width))
+        np.subtract(y, width, out=area[:num_points])
+        np.add(y[::-1], width[::-1], out=area[num_points:])
         return {
             **self._common_options(first_trace),
             "x": np.concatenate((self.x, self.x[::-1])),
-            "y": np.concatenate((lower, upper[::-1])),
+            "y": area,
             "mode": "none",
             "fill": "toself",
             "fillcolor": self.color,
@@ -57,7 +57,7 @@ class Band(_base.Refinery, graph.Mixin):
             "kpoint_distances": dispersion["kpoint_distances"],
             "kpoint_labels": dispersion["kpoint_labels"],
             "fermi_energy": self._raw_data.fermi_energy,
-            **self._shift_dispersion_by_fermi_energy(dispersion),
+            **self._shift_eigenvalues_by_fermi_energy(dispersion["eigenvalues"]),
             **self._read_occupations(),
             "projections": self._read_projections(selection),
         }
@@ -149,16 +149,17 @@ class Band(_base.Refinery, graph.Mixin):
         else:
             return {"occupations": self._raw_data.occupations[0]}
 
-    def _shift_dispersion_by_fermi_energy(self, dispersion):
-        shifted = dispersion["eigenvalues"] - self._raw_data.fermi_energy
+    def _shift_eigenvalues_by_fermi_energy(self, eigenvalues):
+        shifted = eigenvalues - self._raw_data.fermi_energy
         if len(shifted) == 2:
             return {"bands_up": shifted[0], "bands_down": shifted[1]}
         else:
             return {"bands": shifted[0]}
 
     def _shift_series_by_fermi_energy(self, graph):
+        fermi_energy = self._raw_data.fermi_energy
         for series in graph.series:
-            series.y = series.y - self._raw_data.fermi_energy
+            series.y = series.y - fermi_energy
         return graph
 
     def _setup_dataframe_index(self):
@@ -169,21 +170,14 @@ class Band(_base.Refinery, graph.Mixin):
         ]
 
     def _extract_relevant_data(self, selection):
-        relevant_keys = (
-            "bands",
-            "bands_up",
-            "bands_down",
-            "occupations",
-            "occupations_up",
-            "occupations_down",
-        )
-        data = {}
-        for key, value in self.to_dict().items():
-            if key in relevant_keys:
-                data[key] = _to_series(value)
-        for key, value in self._read_projections(selection).items():
-            data[key] = _to_series(value)
-        return data
+        # the k-point distances and labels are not needed, so avoid to_dict
+        eigenvalues = self._raw_data.dispersion.eigenvalues[:]
+        data = {
+            **self._shift_eigenvalues_by_fermi_energy(eigenvalues),
+            **self._read_occupations(),
+            **self._read_projections(selection),
+        }
+        return {key: _to_series(value) for key, value in data.items()}
 
 
 def _index_string(kpoint, band):
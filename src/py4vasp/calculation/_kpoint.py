@@ -1,6 +1,5 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
-import functools
 from fractions import Fraction
 
 import numpy as np
@@ -146,13 +145,14 @@ reciprocal"""
             on the distance between the points.
         """
         cell = _last_step(self._raw_data.cell.lattice_vectors)
-        cartesian_kpoints = np.linalg.solve(cell, self._raw_data.coordinates[:].T).T
-        kpoint_lines = np.split(cartesian_kpoints, self.number_lines())
-        kpoint_norms = [_line_distances(line) for line in kpoint_lines]
-        concatenate_distances = lambda current, addition: (
-            np.concatenate((current, addition + current[-1]))
-        )
-        return functools.reduce(concatenate_distances, kpoint_norms)
+        reciprocal_cell = np.linalg.inv(cell).T
+        cartesian_kpoints = self._raw_data.coordinates[:] @ reciprocal_cell
+        kpoint_lines = cartesian_kpoints.reshape(self.number_lines(), -1, 3)
+        line_distances = _line_distances(kpoint_lines)
+        # every line starts where the previous one ended
+        line_ends = line_distances[:-1, -1]
+        line_offsets = np.concatenate(([0.0], np.cumsum(line_ends)))
+        return (line_distances + line_offsets[:, np.newaxis]).flatten()
 
     @_base.data_access
     @documentation.format(selection=_kpoints_selection)
@@ -261,10 +261,10 @@ def _last_step(lattice_vectors):
         return lattice_vectors[-1]
 
 
-def _line_distances(coordinates):
-    distances = np.zeros(len(coordinates))
-    norms = np.linalg.norm(coordinates[1:] - coordinates[:-1], axis=1)
-    distances[1:] = np.cumsum(norms)
+def _line_distances(lines):
+    distances = np.zeros(lines.shape[:-1])
+    norms = np.linalg.norm(np.diff(lines, axis=1), axis=-1)
+    distances[:, 1:] = np.cumsum(norms, axis=1)
     return distances
 
 
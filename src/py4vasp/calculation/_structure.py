@@ -7,13 +7,15 @@ import numpy as np
 
 from py4vasp import calculation, exception, raw
 from py4vasp._third_party.viewer.viewer3d import Viewer3d
-from py4vasp._util import documentation, import_, reader
+from py4vasp._util import documentation, import_
 from py4vasp.calculation import _base, _slice, _topology
 
 ase = import_.optional("ase")
 ase_io = import_.optional("ase.io")
 mdtraj = import_.optional("mdtraj")
 
+_ELEMENT_FORMAT = "%21.16f"
+
 
 @dataclass
 class _Format:
@@ -27,7 +29,7 @@ class _Format:
         return f"{topology}{step_string}{self.newline}"
 
     def scaling_factor(self, scale):
-        return f"{self._element_to_string(scale)}{self.newline}".lstrip()
+        return f"{_ELEMENT_FORMAT % scale}{self.newline}".lstrip()
 
     def ion_list(self, topology):
         return f"{topology.to_POSCAR(self.newline)}{self.newline}"
@@ -36,15 +38,13 @@ class _Format:
         return f"Direct{self.newline}"
 
     def vectors_to_table(self, vectors):
-        rows = (self._vector_to_row(vector) for vector in vectors)
-        return f"{self.begin_table}{self.row_separator.join(rows)}{self.end_table}"
-
-    def _vector_to_row(self, vector):
-        elements = (self._element_to_string(element) for element in vector)
-        return self.column_separator.join(elements)
-
-    def _element_to_string(self, element):
-        return f"{element:21.16f}"
+        vectors = np.asarray(vectors)
+        column_separator = self.column_separator.replace("%", "%%")
+        row_separator = self.row_separator.replace("%", "%%")
+        row_format = column_separator.join([_ELEMENT_FORMAT] * vectors.shape[-1])
+        table_format = row_separator.join([row_format] * len(vectors))
+        table = table_format % tuple(vectors.flatten())
+        return f"{self.begin_table}{table}{self.end_table}"
 
 
 @documentation.format(examples=_slice.examples("structure"))
@@ -109,11 +109,12 @@ class Structure(_slice.Mixin, _base.Refinery):
 
     def _create_repr(self, format_=_Format()):
         step = self._get_last_step()
+        topology = self._topology()
         lines = (
-            format_.comment_line(self._topology(), self._step_string()),
+            format_.comment_line(topology, self._step_string()),
             format_.scaling_factor(self._scale()),
             format_.vectors_to_table(self._raw_data.cell.lattice_vectors[step]),
-            format_.ion_list(self._topology()),
+            format_.ion_list(topology),
             format_.coordinate_system(),
             format_.vectors_to_table(self._raw_data.positions[step]),
         )
@@ -133,11 +134,12 @@ class Structure(_slice.Mixin, _base.Refinery):
 
         {examples}
         """
+        topology = self._topology()
         return {
             "lattice_vectors": self._lattice_vectors(),
             "positions": self._positions(),
-            "elements": self._topology().elements(),
-            "names": self._topology().names(),
+            "elements": topology.elements(),
+            "names": topology.names(),
         }
 
     @_base.data_access
@@ -186,11 +188,10 @@ class Structure(_slice.Mixin, _base.Refinery):
                 "Converting multiple structures to ASE trajectories is not implemented."
             )
             raise exception.NotImplemented(message)
-        data = self.to_dict()
         structure = ase.Atoms(
-            symbols=data["elements"],
-            cell=data["lattice_vectors"],
-            scaled_positions=data["positions"],
+            symbols=self._topology().elements(),
+            cell=self._lattice_vectors(),
+            scaled_positions=self._positions(),
             pbc=True,
         )
         num_atoms_prim = len(structure)
@@ -203,9 +204,10 @@ class Structure(_slice.Mixin, _base.Refinery):
                     "supercell is either an integer or a list of 3 integers."
                 )
                 raise exception.IncorrectUsage(error_message) from err
-        num_atoms_super = len(structure)
-        order = sorted(range(num_atoms_super), key=lambda n: n % num_atoms_prim)
-        return structure[order]
+        num_copies = len(structure) // num_atoms_prim
+        # group all copies of the same atom together
+        order = np.arange(len(structure)).reshape(num_copies, num_atoms_prim).T
+        return structure[order.flatten()]
 
     @_base.data_access
     @documentation.format(examples=_slice.examples("structure", "to_mdtraj"))
@@ -224,10 +226,10 @@ class Structure(_slice.Mixin, _base.Refinery):
         if not self._is_slice:
             message = "Converting a single structure to mdtraj is not implemented."
             raise exception.NotImplemented(message)
-        data = self.to_dict()
-        xyz = data["positions"] @ data["lattice_vectors"] * self.A_to_nm
+        lattice_vectors = self._lattice_vectors() * self.A_to_nm
+        xyz = self._positions() @ lattice_vectors
         trajectory = mdtraj.Trajectory(xyz, self._topology().to_mdtraj())
-        trajectory.unitcell_vectors = data["lattice_vectors"] * Structure.A_to_nm
+        trajectory.unitcell_vectors = lattice_vectors
         return trajectory
 
     @_base.data_access
@@ -297,16 +299,22 @@ class Structure(_slice.Mixin, _base.Refinery):
         return calculation.topology.from_data(self._raw_data.topology)
 
     def _lattice_vectors(self):
-        lattice_vectors = _LatticeVectors(self._raw_data.cell.lattice_vectors)
-        return self._scale() * lattice_vectors[self._get_steps()]
+        steps = self._get_steps()
+        try:
+            lattice_vectors = self._raw_data.cell.lattice_vectors[steps]
+        except (ValueError, IndexError, TypeError) as err:
+            message = _lattice_vectors_error_message(steps, err)
+            raise exception.IncorrectUsage(message) from err
+        return self._scale() * lattice_vectors
 
     def _scale(self):
-        if isinstance(self._raw_data.cell.scale, np.float_):
-            return self._raw_data.cell.scale
-        if not self._raw_data.cell.scale.is_none():
-            return self._raw_data.cell.scale[()]
-        else:
+        scale = self._raw_data.cell.scale
+        if isinstance(scale, np.float_):
+            return scale
+        elif scale.is_none():
             return 1.0
+        else:
+            return scale[()]
 
     def _positions(self):
         return self._raw_data.positions[self._get_steps()]
@@ -348,15 +356,14 @@ class Structure(_slice.Mixin, _base.Refinery):
         return self._raw_data.positions.ndim == 3
 
 
-class _LatticeVectors(reader.Reader):
-    def error_message(self, key, err):
-        key = np.array(key)
-        steps = key if key.ndim == 0 else key[0]
-        return (
-            f"Error reading the lattice vectors. Please check if the steps "
-            f"`{steps}` are properly formatted and within the boundaries. "
-            "Additionally, you may consider the original error message:\n" + err.args[0]
-        )
+def _lattice_vectors_error_message(key, err):
+    key = np.array(key)
+    steps = key if key.ndim == 0 else key[0]
+    return (
+        f"Error reading the lattice vectors. Please check if the steps "
+        f"`{steps}` are properly formatted and within the boundaries. "
+        "Additionally, you may consider the original error message:\n" + err.args[0]
+    )
 
 
 def _cell_from_ase(structure):
@@ -367,12 +374,15 @@ def _cell_from_ase(structure):
 def _replace_or_set_elements(poscar, elements):
     line_with_elements = 5
     elements = "" if not elements else " ".join(elements)
-    lines = poscar.split("\n")
+    # only the lines up to the one with the elements need to be inspected
+    lines = poscar.split("\n", line_with_elements + 1)
     if _elements_not_in_poscar(lines[line_with_elements]):
         _raise_error_if_elements_not_set(elements)
         lines.insert(line_with_elements, elements)
     elif elements:
         lines[line_with_elements] = elements
+    else:
+        return poscar
     return "\n".join(lines)
 
 